@@ -1,13 +1,18 @@
 # pywinctl/__init__.py
 
 import sys
+import logging
+
+# Library logging: stay silent (no lastResort output to stderr) unless the application configures logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 if sys.platform != 'win32':
-    print("Warning: pywinctl is designed for Windows and may not function correctly on other platforms.")
+    logging.getLogger(__name__).warning(
+        "pywinctl is designed for Windows and may not function correctly on other platforms.")
     # Or raise ImportError("pywinctl requires Windows.")
 
 # Import key components to be accessible directly from the package
-from ._main import Window, get_window_by_title, get_active_window, get_all_windows, init_winctl
+from ._main import Window, get_window_by_title, get_active_window, get_all_windows, set_window_pos_batch, shutdown
 from ._exceptions import PyWinCtlError, WindowNotFoundError, InvalidWindowError, WindowsAPIError
 
 __version__ = "0.1.0"
@@ -18,11 +23,10 @@ __all__ = [
     'get_window_by_title',
     'get_active_window',
     'get_all_windows',
+    'set_window_pos_batch',
+    'shutdown',
     'PyWinCtlError',
     'WindowNotFoundError',
     'InvalidWindowError',
     'WindowsAPIError',
-    'init_winctl'
 ]
-
-# You could add platform checks or initial setup here if needed
\ No newline at end of file
@@ -0,0 +1,29 @@
+# pywinctl/_lazy.py
+
+"""Deferred imports for heavyweight or optional dependencies."""
+
+import importlib
+
+_MISSING = object()
+_modules = {}
+
+def _load(name, optional=False):
+    """Import `name` on first use and cache it. Optional modules yield None if missing."""
+    module = _modules.get(name, _MISSING)
+    if module is _MISSING:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            if not optional:
+                raise
+            module = None
+        _modules[name] = module
+    return module
+
+def pygetwindow():
+    """The pygetwindow module (required for substring title search)."""
+    return _load("pygetwindow")
+
+def psutil():
+    """The psutil module, or None if it is not installed."""
+    return _load("psutil", optional=True)
@@ -1,184 +1,218 @@
 # pywinctl/_main.py
 
 import time
-import pygetwindow as gw
+import ctypes
+import logging
+import weakref
+import functools
 from typing import List, Optional, Tuple, Dict, Any
 
 # Import from local modules using relative paths
-from ._exceptions import WindowNotFoundError, InvalidWindowError, WindowsAPIError
+from ._exceptions import PyWinCtlError, WindowNotFoundError, InvalidWindowError, WindowsAPIError
 from . import _win_api as api # Use the alias 'api' for clarity
+from . import _lazy # pygetwindow is only imported for substring title search
+
+logger = logging.getLogger(__name__)
+
+# How long (seconds) a successful IsWindow check is trusted before re-checking.
+_VALIDITY_TTL = 0.05
+# How long (seconds) a fetched window RECT is reused by position/size/box.
+_RECT_TTL = 0.05
+
+# Live Window objects by HWND, so finders hand back the same object (and its
+# warm caches) for a window the caller already holds.
+_window_cache: "weakref.WeakValueDictionary[int, Window]" = weakref.WeakValueDictionary()
+
+def _win_prop(fn):
+    """
+    Turns a Window method into a read-only property that validates the HWND first.
+    Our own errors pass through; anything else is wrapped in PyWinCtlError.
+    """
+    @functools.wraps(fn)
+    def getter(self):
+        self._validate_hwnd()
+        try:
+            return fn(self)
+        except (InvalidWindowError, WindowsAPIError):
+            raise
+        except Exception as e:
+            raise PyWinCtlError(f"Unexpected error getting {fn.__name__} for HWND {self._hwnd}: {e}") from e
+    return property(getter)
+
+def _win_method(fn):
+    """
+    Error translation for Window control methods.
+    There is no IsWindow pre-check: the API call itself reports a closed window,
+    and ERROR_INVALID_WINDOW_HANDLE is surfaced as InvalidWindowError.
+    """
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return fn(self, *args, **kwargs)
+        except (InvalidWindowError, WindowsAPIError, ValueError):
+            raise
+        except Exception as e:
+            raise PyWinCtlError(f"Unexpected error in {fn.__name__} for HWND {self._hwnd}: {e}") from e
+    return wrapper
 
 class Window:
     """Represents a single Windows application window."""
 
-    def __init__(self, gw_window: gw.Win32Window):
+    # No per-instance __dict__; __weakref__ keeps instances usable in _window_cache
+    __slots__ = ('_hwnd', '_valid_until', '_rect_cache', '_rect_expires', '_last_title', '__weakref__')
+
+    def __init__(self, hwnd: int):
         """
         Initialize a Window object. Usually created via finder functions.
         Args:
-            gw_window: An underlying pygetwindow Win32Window object.
+            hwnd: The window handle. A pygetwindow Win32Window is also accepted
+                for backwards compatibility; only its HWND is kept.
         """
-        if not isinstance(gw_window, gw.Win32Window):
-            raise TypeError("Window must be initialized with a pygetwindow.Win32Window object.")
+        hwnd = getattr(hwnd, "_hWnd", hwnd) # Unwrap legacy pygetwindow objects
+        if not isinstance(hwnd, int):
+            raise TypeError("Window must be initialized with an integer HWND.")
 
-        self._gw_window = gw_window
-        # Store HWND immediately as it's the primary key
-        try:
-             self._hwnd = gw_window._hWnd # Accessing Hwnd property from pygetwindow
-        except AttributeError:
-             raise ValueError("The provided pygetwindow object does not have an Hwnd attribute.")
-        except gw.PyGetWindowException as e:
-             # Handle cases where the window might have closed between finding and init
-             raise InvalidWindowError(f"Failed to get HWND from pygetwindow object: {e}") from e
-
-        # Validate HWND right away
-        self._validate_hwnd()
+        # The HWND is the primary key
+        self._hwnd = hwnd
+
+        # monotonic() deadline until which the HWND is assumed valid
+        self._valid_until = 0.0
+        # Last (left, top, right, bottom) from GetWindowRect and its expiry deadline
+        self._rect_cache = None
+        self._rect_expires = 0.0
+        # Most recently observed title, shown by __repr__ without an API call
+        self._last_title = None
+
+        # Validation is deferred to first use: most wrapped windows are never touched
+        _window_cache[self._hwnd] = self
 
 
     def _validate_hwnd(self):
-        """Checks if the stored HWND is still valid."""
+        """
+        Checks if the stored HWND is still valid.
+        A successful check is cached for _VALIDITY_TTL seconds, so batched
+        property reads only pay for one IsWindow call.
+        """
+        if time.monotonic() < self._valid_until:
+            return
+        if not api.is_window(self._hwnd):
+            raise InvalidWindowError(f"Window with HWND {self._hwnd} no longer exists or is invalid.")
+        self._valid_until = time.monotonic() + _VALIDITY_TTL
+
+    def validate(self) -> bool:
+        """
+        Checks with the OS whether the window still exists.
+        Unlike the properties, this never raises; it returns False for a closed window.
+        """
+        self._valid_until = 0.0 # Always ask the OS, ignoring the cached result
         try:
-            # Use a lightweight check first
-            if not self._hwnd or not api.win32gui.IsWindow(self._hwnd):
-                raise InvalidWindowError(f"Window with HWND {self._hwnd} no longer exists or is invalid.")
-        except api.pywintypes.error as e:
-             # Catch potential API errors during IsWindow check
-              raise WindowsAPIError(f"Error checking window validity for HWND {self._hwnd}: {e}", e.winerror)
-
-    def _update_gw_window(self):
+            self._validate_hwnd()
+        except (InvalidWindowError, WindowsAPIError):
+            return False
+        return True
+
+    def _get_rect(self) -> Tuple[int, int, int, int]:
+        """Returns the window RECT, reusing the cached one for up to _RECT_TTL seconds."""
+        now = time.monotonic()
+        if self._rect_cache is not None and now < self._rect_expires:
+            return self._rect_cache
+        rect = api.get_window_rect(self._hwnd)
+        self._rect_cache = rect
+        self._rect_expires = now + _RECT_TTL
+        return rect
+
+    def snapshot(self) -> "api.WindowSnapshot":
         """
-        Refreshes the internal pygetwindow object if needed (e.g., title changed).
-        This is somewhat expensive, so use sparingly. Best to rely on direct API calls.
+        Reads the title, rect, class name, visible/minimized/maximized state and
+        restored rect at once.
+
+        This is the preferred way to inspect many windows (e.g.
+        `[w.snapshot() for w in get_all_windows()]`): it crosses into user32 once
+        per value with no per-property validation or wrapper overhead.
+        The cached rect used by position/size/box is refreshed as a side effect.
+
+        Returns:
+            A WindowSnapshot(title, rect, class_name, visible, minimized, maximized,
+            normal_rect) named tuple; rects are (left, top, right, bottom),
+            normal_rect being the restored position in workspace coordinates.
         """
         try:
-            # Find the window again by its HWND to get the latest state
-            updated_gw = gw.Win32Window(self._hwnd)
-            self._gw_window = updated_gw
-        except gw.PyGetWindowException:
-            # If it can't be found by HWND, it's likely closed
-            raise InvalidWindowError(f"Window with HWND {self._hwnd} could not be refreshed (likely closed).")
+            snap = api.get_window_snapshot(self._hwnd)
+        except (InvalidWindowError, WindowsAPIError) as e:
+            raise e
         except Exception as e:
-             raise PyWinCtlError(f"Unexpected error refreshing window state for HWND {self._hwnd}: {e}")
+            raise PyWinCtlError(f"Unexpected error taking snapshot for HWND {self._hwnd}: {e}") from e
+        # A successful read proves the handle is valid
+        now = time.monotonic()
+        self._valid_until = now + _VALIDITY_TTL
+        self._rect_cache = snap.rect
+        self._rect_expires = now + _RECT_TTL
+        self._last_title = snap.title
+        return snap
+
+    def invalidate(self):
+        """
+        Drops any cached state (validity, rect) so the next access queries the OS.
+        Called automatically by methods that change the window; call it yourself
+        if the window was changed by something outside this object.
+        """
+        self._valid_until = 0.0
+        self._rect_cache = None
+        self._rect_expires = 0.0
 
 
     # --- Properties ---
     @property
     def hwnd(self) -> int:
         """The window handle (HWND)."""
-        self._validate_hwnd() # Ensure window is still valid before returning handle
         return self._hwnd
 
-    @property
+    @_win_prop
     def title(self) -> str:
         """The current window title."""
-        self._validate_hwnd()
-        try:
-            # Use direct API for potentially faster/more current title
-            return api.get_window_title(self._hwnd)
-            # Fallback to pygetwindow object if direct API fails? Less likely needed now.
-            # return self._gw_window.title
-        except (InvalidWindowError, WindowsAPIError) as e:
-             # Re-raise our specific errors
-             raise e
-        except Exception as e: # Catch unexpected errors
-            raise PyWinCtlError(f"Unexpected error getting title for HWND {self._hwnd}: {e}") from e
-
+        title = api.get_window_title_into(self._hwnd, api.text_buffer())
+        self._last_title = title
+        return title
 
-    @property
+    @_win_prop
     def position(self) -> Tuple[int, int]:
         """The current position (x, y) of the window's top-left corner."""
-        self._validate_hwnd()
-        try:
-            rect = api.get_window_rect(self._hwnd)
-            return rect[0], rect[1]
-            # return self._gw_window.topleft
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error getting position for HWND {self._hwnd}: {e}") from e
+        rect = self._get_rect()
+        return rect[0], rect[1]
 
-    @property
+    @_win_prop
     def size(self) -> Tuple[int, int]:
         """The current size (width, height) of the window."""
-        self._validate_hwnd()
-        try:
-            rect = api.get_window_rect(self._hwnd)
-            width = rect[2] - rect[0]
-            height = rect[3] - rect[1]
-            return width, height
-            # return self._gw_window.size
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error getting size for HWND {self._hwnd}: {e}") from e
+        rect = self._get_rect()
+        return rect[2] - rect[0], rect[3] - rect[1]
 
-    @property
+    @_win_prop
     def box(self) -> Tuple[int, int, int, int]:
         """The current bounding box (left, top, width, height)."""
-        self._validate_hwnd()
-        try:
-             rect = api.get_window_rect(self._hwnd)
-             width = rect[2] - rect[0]
-             height = rect[3] - rect[1]
-             return rect[0], rect[1], width, height
-            # return self._gw_window.box
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error getting box for HWND {self._hwnd}: {e}") from e
-
+        rect = self._get_rect()
+        return rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]
 
-    @property
+    @_win_prop
     def is_active(self) -> bool:
         """True if the window is currently the active foreground window."""
-        self._validate_hwnd()
-        try:
-            return api.get_active_window_hwnd() == self._hwnd
-            # return self._gw_window.isActive
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error checking active status for HWND {self._hwnd}: {e}") from e
-
+        return api.get_active_window_hwnd() == self._hwnd
 
-    @property
+    @_win_prop
     def is_minimized(self) -> bool:
         """True if the window is currently minimized."""
-        self._validate_hwnd()
-        try:
-            return api.is_minimized(self._hwnd)
-            # return self._gw_window.isMinimized
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error checking minimized status for HWND {self._hwnd}: {e}") from e
+        return api.is_minimized(self._hwnd)
 
-
-    @property
+    @_win_prop
     def is_maximized(self) -> bool:
         """True if the window is currently maximized."""
-        self._validate_hwnd()
-        try:
-            return api.is_maximized(self._hwnd)
-            # return self._gw_window.isMaximized
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error checking maximized status for HWND {self._hwnd}: {e}") from e
+        return api.is_maximized(self._hwnd)
 
-
-    @property
+    @_win_prop
     def is_visible(self) -> bool:
         """True if the window is currently visible (not hidden)."""
-        self._validate_hwnd()
-        try:
-             # Note: Minimized windows are often considered "visible" by IsWindowVisible
-             # We might want a stricter definition later if needed.
-            return api.is_window_visible(self._hwnd)
-            # return self._gw_window.visible
-        except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error checking visibility for HWND {self._hwnd}: {e}") from e
+        # Note: Minimized windows are often considered "visible" by IsWindowVisible
+        # We might want a stricter definition later if needed.
+        return api.is_window_visible(self._hwnd)
 
 
     @property
@@ -192,13 +226,14 @@ class Window:
              # If the window is invalid, we can't get PID
              return None
         except Exception as e:
-            print(f"Warning: Unexpected error getting PID for HWND {self._hwnd}: {e}")
+            logger.warning("Unexpected error getting PID for HWND %s: %s", self._hwnd, e)
             return None
 
     @property
     def process_info(self) -> Dict[str, Any]:
         """
-        Detailed information about the owner process (requires psutil).
+        Detailed information about the owner process (cwd, username and status
+        require psutil and are None without it).
         Returns a dictionary with process details or an error message.
         """
         pid = self.process_id
@@ -214,161 +249,93 @@ class Window:
         """The window's class name."""
         self._validate_hwnd()
         try:
-            return api.get_window_classname(self._hwnd)
+            return api.get_window_classname_into(self._hwnd, api.text_buffer())
         except (InvalidWindowError, WindowsAPIError):
             return None # Or re-raise? Depends on desired strictness
         except Exception as e:
-            print(f"Warning: Unexpected error getting class name for HWND {self._hwnd}: {e}")
+            logger.warning("Unexpected error getting class name for HWND %s: %s", self._hwnd, e)
             return None
 
 
     # --- Control Methods ---
 
+    @_win_method
     def move_to(self, x: int, y: int):
         """Moves the window's top-left corner to the specified coordinates."""
-        self._validate_hwnd()
-        try:
-            api.move_window(self._hwnd, int(x), int(y))
-            # self._gw_window.moveTo(int(x), int(y)) # pygetwindow alternative
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error moving HWND {self._hwnd}: {e}") from e
+        self.invalidate()
+        api.move_window(self._hwnd, int(x), int(y))
 
+    @_win_method
     def resize_to(self, width: int, height: int):
         """Resizes the window to the specified width and height."""
-        self._validate_hwnd()
         if width <= 0 or height <= 0:
              raise ValueError("Width and height must be positive integers.")
-        try:
-            api.resize_window(self._hwnd, int(width), int(height))
-            # self._gw_window.resizeTo(int(width), int(height)) # pygetwindow alternative
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error resizing HWND {self._hwnd}: {e}") from e
+        self.invalidate()
+        api.resize_window(self._hwnd, int(width), int(height))
 
+    @_win_method
     def move_resize(self, x: int, y: int, width: int, height: int):
         """Moves and resizes the window in one operation."""
-        self._validate_hwnd()
         if width <= 0 or height <= 0:
              raise ValueError("Width and height must be positive integers.")
-        try:
-            api.set_window_pos(self._hwnd, int(x), int(y), int(width), int(height))
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error moving/resizing HWND {self._hwnd}: {e}") from e
-
+        self.invalidate()
+        api.set_window_pos(self._hwnd, int(x), int(y), int(width), int(height))
 
+    @_win_method
     def minimize(self):
         """Minimizes the window."""
-        self._validate_hwnd()
-        try:
-            api.minimize(self._hwnd)
-            # self._gw_window.minimize()
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error minimizing HWND {self._hwnd}: {e}") from e
-
+        self.invalidate()
+        api.minimize(self._hwnd)
 
+    @_win_method
     def maximize(self):
         """Maximizes the window."""
-        self._validate_hwnd()
-        try:
-            api.maximize(self._hwnd)
-            # self._gw_window.maximize()
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error maximizing HWND {self._hwnd}: {e}") from e
-
+        self.invalidate()
+        api.maximize(self._hwnd)
 
+    @_win_method
     def restore(self):
         """Restores the window (from minimized or maximized state)."""
-        self._validate_hwnd()
-        try:
-            api.restore(self._hwnd)
-            # self._gw_window.restore()
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error restoring HWND {self._hwnd}: {e}") from e
-
+        self.invalidate()
+        api.restore(self._hwnd)
 
+    @_win_method
     def close(self):
         """Closes the window (sends WM_CLOSE)."""
-        self._validate_hwnd()
+        self.invalidate() # The handle is about to go away; re-check next time
         try:
             api.close_window(self._hwnd)
-            # self._gw_window.close() # pygetwindow alternative
-        except (InvalidWindowError, WindowsAPIError) as e:
-            # It's okay if InvalidWindowError happens *during* close
-             if isinstance(e, InvalidWindowError):
-                 pass # Window likely closed successfully or was already gone
-             else:
-                 raise e # Re-raise other API errors
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error closing HWND {self._hwnd}: {e}") from e
-
+        except InvalidWindowError:
+            pass # Window likely closed successfully or was already gone
 
+    @_win_method
     def activate(self):
         """Activates the window (brings it to the foreground)."""
-        self._validate_hwnd()
-        try:
-            api.set_foreground_window(self._hwnd)
-            # self._gw_window.activate() # pygetwindow's activate can be less reliable
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error activating HWND {self._hwnd}: {e}") from e
-
+        self.invalidate() # Restores the window first if it is minimized
+        api.set_foreground_window(self._hwnd)
 
+    @_win_method
     def hide(self):
         """Hides the window."""
-        self._validate_hwnd()
-        try:
-            api.hide(self._hwnd)
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error hiding HWND {self._hwnd}: {e}") from e
-
+        api.hide(self._hwnd)
 
+    @_win_method
     def show(self):
         """Shows a previously hidden window."""
-        self._validate_hwnd()
-        try:
-            api.show(self._hwnd)
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error showing HWND {self._hwnd}: {e}") from e
-
+        api.show(self._hwnd)
 
+    @_win_method
     def set_title(self, title: str):
         """Sets the window title."""
-        self._validate_hwnd()
-        try:
-            api.set_window_title(self._hwnd, str(title))
-            # Title changed, update internal pygetwindow object if we rely on it elsewhere
-            # self._update_gw_window() # Usually not needed if using direct API calls
-        except (InvalidWindowError, WindowsAPIError) as e:
-            raise e
-        except Exception as e:
-            raise PyWinCtlError(f"Unexpected error setting title for HWND {self._hwnd}: {e}") from e
-
+        self.invalidate()
+        title = str(title)
+        api.set_window_title(self._hwnd, title)
+        self._last_title = title
 
+    @_win_method
     def set_always_on_top(self, enable: bool = True):
-         """Sets the window to be always on top (or not)."""
-         self._validate_hwnd()
-         try:
-             api.set_always_on_top(self._hwnd, enable)
-         except (InvalidWindowError, WindowsAPIError) as e:
-             raise e
-         except Exception as e:
-             raise PyWinCtlError(f"Unexpected error setting always-on-top for HWND {self._hwnd}: {e}") from e
+        """Sets the window to be always on top (or not)."""
+        api.set_always_on_top(self._hwnd, enable)
 
 
     def wait_for_active(self, timeout: float = 5.0) -> bool:
@@ -381,6 +348,18 @@ class Window:
         Returns:
             True if the window became active within the timeout, False otherwise.
         """
+        try:
+            self._validate_hwnd()
+            return api.wait_for_foreground(self._hwnd, timeout)
+        except InvalidWindowError:
+            return False # Window closed before we could wait
+        except WindowsAPIError as e:
+            # The WinEvent hook could not be installed; fall back to polling
+            logger.warning("Foreground hook unavailable, polling instead: %s", e)
+        return self._poll_for_active(timeout)
+
+    def _poll_for_active(self, timeout: float) -> bool:
+        """Polling fallback for wait_for_active."""
         start_time = time.monotonic()
         while time.monotonic() - start_time < timeout:
             try:
@@ -389,28 +368,22 @@ class Window:
             except InvalidWindowError:
                 return False # Window closed while waiting
             except PyWinCtlError as e:
-                 print(f"Warning: Error checking active status during wait: {e}")
+                 logger.warning("Error checking active status during wait: %s", e)
                  # Decide whether to continue or raise based on the error
                  time.sleep(0.1) # Avoid busy-waiting on error
             time.sleep(0.05) # Short sleep to avoid high CPU usage
         return False
 
     def __repr__(self) -> str:
-        try:
-             title = self.title # Get current title
-             hwnd = self._hwnd # Use stored hwnd
-        except (InvalidWindowError, PyWinCtlError):
-             # If getting title fails (window closed?), provide basic info
-             title = "<Invalid or Closed Window>"
-             hwnd = self._hwnd # Show the last known HWND
-        return f"Window(hwnd={hwnd}, title='{title}')"
+        # Uses the last title seen by .title/.snapshot()/set_title() (None if never
+        # read) so that repr never hits user32; read .title for a fresh value.
+        return f"Window(hwnd={self._hwnd}, title={self._last_title!r})"
 
     def __eq__(self, other) -> bool:
         """Two Window objects are equal if they represent the same window handle."""
         if not isinstance(other, Window):
             return NotImplemented
-        # Check HWND directly, avoid property access if possible to prevent validation errors
-        # if the object state is uncertain (though __init__ validates)
+        # Compare HWNDs directly: property access would validate, and raise for a closed window
         return self._hwnd == other._hwnd
 
     def __hash__(self) -> int:
@@ -420,6 +393,64 @@ class Window:
 
 # --- Finder Functions ---
 
+def _wrap_hwnd(hwnd: int) -> Window:
+    """Returns the live Window for `hwnd` if one exists, otherwise creates it."""
+    window = _window_cache.get(hwnd)
+    if window is None:
+        window = Window(hwnd)
+    return window
+
+def _enum_top_hwnds(visible_only: bool = True) -> List[int]:
+    """
+    Lists top-level HWNDs with a single EnumWindows pass.
+
+    Args:
+        visible_only: If True, skips hidden windows and windows without a title
+            (tooltips, message-only and other helper windows) inside the callback,
+            before any Python object is built for them.
+    """
+    hwnds = []
+    is_visible = api.user32.IsWindowVisible
+    title_length = api.user32.GetWindowTextLengthW
+
+    def _callback(hwnd, _lparam):
+        if hwnd and (not visible_only or (is_visible(hwnd) and title_length(hwnd))):
+            hwnds.append(hwnd)
+        return True # Continue enumeration
+
+    if not api.user32.EnumWindows(api.WNDENUMPROC(_callback), 0):
+        raise WindowsAPIError("EnumWindows failed", api._get_last_error())
+    return hwnds
+
+def _find_hwnd_by_exact_title(title: str) -> int:
+    """
+    Returns the first visible top-level HWND whose title equals `title`, or 0.
+    Enumeration stops at the first match; windows whose title length differs
+    are rejected without reading their text.
+    """
+    if not title:
+        return 0 # Untitled windows are never matched
+    title_length = api.user32.GetWindowTextLengthW # Resolved once, not per window
+    is_visible = api.user32.IsWindowVisible
+    get_text = api.user32.GetWindowTextW
+    target_len = len(title)
+    buf = ctypes.create_unicode_buffer(target_len + 1)
+    found = [0]
+
+    def _callback(hwnd, _lparam):
+        if (hwnd and title_length(hwnd) == target_len
+                and is_visible(hwnd)
+                and get_text(hwnd, buf, target_len + 1)
+                and buf.value == title):
+            found[0] = hwnd
+            return False # Stop enumeration
+        return True
+
+    # EnumWindows reports failure when the callback stops it early, so its
+    # return value is not an error indicator here.
+    api.user32.EnumWindows(api.WNDENUMPROC(_callback), 0)
+    return found[0]
+
 def get_window_by_title(title: str, exact_match: bool = False) -> Optional[Window]:
     """
     Finds the first window matching the given title.
@@ -437,44 +468,31 @@ def get_window_by_title(title: str, exact_match: bool = False) -> Optional[Windo
     """
     try:
         if exact_match:
-             # pygetwindow's getWindowsWithTitle does substring match by default.
-             # We need to iterate and check exactly.
-             all_titles = gw.getAllTitles()
-             # Filter out empty titles which pygetwindow might return
-             valid_windows = [w for w in gw.getAllWindows() if w.title]
-             found_gw = None
-             for win in valid_windows:
-                 try:
-                     if win.title == title:
-                        found_gw = win
-                        break
-                 except gw.PyGetWindowException:
-                      continue # Window might have closed during iteration
-             if not found_gw:
+             found_hwnd = _find_hwnd_by_exact_title(title)
+             if not found_hwnd:
                  raise WindowNotFoundError(f"No window found with exact title: '{title}'")
-             return Window(found_gw)
+             return _wrap_hwnd(found_hwnd)
 
         else:
             # Use pygetwindow's substring matching (case-insensitive)
-            gw_windows = gw.getWindowsWithTitle(title)
+            gw = _lazy.pygetwindow()
+            try:
+                gw_windows = gw.getWindowsWithTitle(title)
+            except gw.PyGetWindowException as e:
+                # Catch potential errors during window searching/listing
+                raise PyWinCtlError(f"Error during pygetwindow operation: {e}") from e
             if not gw_windows:
                 raise WindowNotFoundError(f"No window found with title containing: '{title}'")
             # Return the first match wrapped in our Window class
-            return Window(gw_windows[0])
+            return _wrap_hwnd(gw_windows[0]._hWnd)
 
-    except gw.PyGetWindowException as e:
-         # Catch potential errors during window searching/listing
-         raise PyWinCtlError(f"Error during pygetwindow operation: {e}") from e
-    # Let WindowNotFoundError pass through
-    except WindowNotFoundError:
+    # Let WindowNotFoundError (and our other errors) pass through
+    except PyWinCtlError:
          raise
     except Exception as e:
         raise PyWinCtlError(f"An unexpected error occurred in get_window_by_title: {e}") from e
 
 
-def init_winctl():
-    print("TEST")
-
 def get_active_window() -> Optional[Window]:
     """
     Gets the currently active (foreground) window.
@@ -484,56 +502,98 @@ def get_active_window() -> Optional[Window]:
         or an error occurs.
     """
     try:
-        active_gw = gw.getActiveWindow()
-        if active_gw:
-            return Window(active_gw)
+        active_hwnd = api.get_active_window_hwnd()
+        # No foreground window is less common but possible (e.g., during a focus change)
+        return _wrap_hwnd(active_hwnd) if active_hwnd else None
+    except (WindowsAPIError, InvalidWindowError) as e:
+        logger.warning("Failed to get active window: %s", e)
+        return None
+    except Exception as e:
+        raise PyWinCtlError(f"An unexpected error occurred getting active window: {e}") from e
+
+def set_window_pos_batch(placements, parallel: bool = False) -> None:
+    """
+    Moves and resizes several windows in one deferred operation, so the system
+    repositions them all in a single pass (e.g. when tiling a workspace).
+
+    Args:
+        placements: Iterable of (window, x, y, width, height) tuples, where
+            window is a Window or an integer HWND.
+        parallel: If True, issue the SetWindowPos calls concurrently from a thread
+            pool instead. Faster when the windows belong to different (possibly
+            slow) applications, but the moves are not applied as one atomic pass.
+
+    Raises:
+        ValueError: If a width or height is not positive.
+        InvalidWindowError: If one of the windows no longer exists. No window is moved
+            (unless parallel=True, where the other windows are still moved).
+        WindowsAPIError: If the batch could not be applied.
+    """
+    items = []
+    windows = []
+    for window, x, y, width, height in placements:
+        if width <= 0 or height <= 0:
+            raise ValueError("Width and height must be positive integers.")
+        if isinstance(window, Window):
+            windows.append(window)
+            window = window._hwnd
+        items.append((window, int(x), int(y), int(width), int(height)))
+    for window in windows:
+        window.invalidate()
+    try:
+        if parallel:
+            api.set_window_pos_parallel(items)
         else:
-            # This case is less common but possible (e.g., no interactive window focused)
-            return None
-    except gw.PyGetWindowException as e:
-        # Could happen if getting active window fails
-        print(f"Warning: Failed to get active window via pygetwindow: {e}")
-        # Fallback using direct API call
-        try:
-             active_hwnd = api.get_active_window_hwnd()
-             if active_hwnd:
-                 # Need to create a pygetwindow object from HWND to initialize our Window class
-                 active_gw_fallback = gw.Win32Window(active_hwnd)
-                 return Window(active_gw_fallback)
-             else:
-                 return None
-        except (WindowsAPIError, gw.PyGetWindowException, InvalidWindowError) as fallback_e:
-             print(f"Warning: Fallback using direct API also failed: {fallback_e}")
-             return None
-        except Exception as e:
-             raise PyWinCtlError(f"An unexpected error occurred getting active window: {e}") from e
+            api.set_window_pos_batch(items)
+    except (InvalidWindowError, WindowsAPIError):
+        raise
+    except Exception as e:
+        raise PyWinCtlError(f"An unexpected error occurred in set_window_pos_batch: {e}") from e
 
-def get_all_windows() -> List[Window]:
+def get_all_windows(visible_only: bool = True, validate: bool = False) -> List[Window]:
     """
-    Gets a list of all visible windows.
+    Gets a list of top-level windows.
+
+    Args:
+        visible_only: If True (default), only visible windows with a non-empty title
+            are returned. If False, every top-level window is returned, including
+            hidden and untitled helper windows.
+        validate: If True, also validates every window up front, dropping the ones
+            that closed since enumeration. By default windows are validated lazily,
+            on first property or method access.
 
     Returns:
         A list of Window objects.
     """
     windows = []
     try:
-        all_gw_windows = gw.getAllWindows()
-        for gw_win in all_gw_windows:
+        for hwnd in _enum_top_hwnds(visible_only):
             try:
-                # Attempt to create our Window object. This also validates the HWND.
-                # Filter out windows with no title or potentially problematic ones early?
-                # if gw_win.title and gw_win.visible and not gw_win.isMinimized: # Example filter
-                windows.append(Window(gw_win))
-            except (InvalidWindowError, ValueError, gw.PyGetWindowException, PyWinCtlError):
+                # Reuse a live Window or wrap the HWND (no syscall unless validating).
+                window = _wrap_hwnd(hwnd)
+                if validate:
+                    window._validate_hwnd()
+                windows.append(window)
+            except (InvalidWindowError, ValueError, PyWinCtlError):
                 # Skip windows that are invalid, closed during iteration,
                 # or cause other issues during Window object creation.
                 continue
             except Exception as e:
-                print(f"Warning: Skipping window due to unexpected error during creation: {e}")
+                logger.warning("Skipping window due to unexpected error during creation: %s", e)
                 continue
 
         return windows
-    except gw.PyGetWindowException as e:
-         raise PyWinCtlError(f"Error getting all windows via pygetwindow: {e}") from e
+    except PyWinCtlError:
+        raise
     except Exception as e:
-        raise PyWinCtlError(f"An unexpected error occurred in get_all_windows: {e}") from e
\ No newline at end of file
+        raise PyWinCtlError(f"An unexpected error occurred in get_all_windows: {e}") from e
+
+def shutdown() -> None:
+    """
+    Removes the WinEvent hook pywinctl installs on first use (it keeps the
+    active window cached) and stops its helper thread.
+    Optional: the thread is a daemon, so this is only needed for a clean
+    teardown, e.g. before unloading pywinctl in a long-running host process.
+    Later calls into pywinctl install the hook again.
+    """
+    api.shutdown()
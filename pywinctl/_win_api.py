@@ -1,28 +1,26 @@
 # pywinctl/_win_api.py
 
+import os
 import sys
 import time
+import logging
+import threading
+import ctypes
+import functools
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from ctypes import wintypes
 
 if sys.platform != 'win32':
     raise ImportError("pywinctl requires the Windows operating system.")
 
-try:
-    import win32gui
-    import win32con
-    import win32api
-    import win32process
-    import pywintypes
-except ImportError:
-    raise ImportError("pywin32 library is required. Please install it using 'pip install pywin32'.")
-
-try:
-    import psutil
-except ImportError:
-    psutil = None # psutil is optional but recommended for process info
-
 from ._exceptions import InvalidWindowError, WindowsAPIError
+from . import _lazy
+
+logger = logging.getLogger(__name__)
 
 # --- Constants ---
+HWND_TOP = 0
 HWND_TOPMOST = -1
 HWND_NOTOPMOST = -2
 SWP_NOMOVE = 0x0002
@@ -30,127 +28,675 @@ SWP_NOSIZE = 0x0001
 SWP_NOZORDER = 0x0004
 SWP_SHOWWINDOW = 0x0040
 SWP_NOACTIVATE = 0x0010
+SW_HIDE = 0
+SW_SHOWMINIMIZED = 2
+SW_MAXIMIZE = 3 # Same value as SW_SHOWMAXIMIZED
+SW_SHOW = 5
+SW_MINIMIZE = 6
+SW_SHOWMINNOACTIVE = 7
+SW_RESTORE = 9
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_DESTROY = 0x8001
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_CLOSE = 0x0010
+WM_QUIT = 0x0012
+PM_NOREMOVE = 0x0000
+SYNCHRONIZE = 0x00100000
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+ERROR_ACCESS_DENIED = 5
+ERROR_INVALID_PARAMETER = 87 # OpenProcess: no process with that PID
+ERROR_INSUFFICIENT_BUFFER = 122
+ERROR_INVALID_WINDOW_HANDLE = 1400
+TEXT_BUFFER_SIZE = 512 # Characters, including the terminating NUL
+PARALLEL_MIN_ITEMS = 3 # Below this, set_window_pos_parallel is not worth the pool hand-off
+PARALLEL_MAX_WORKERS = 32
+FOREGROUND_WAIT = 0.05 # Default max seconds set_foreground_window waits for the switch
+MAX_LONG_PATH = 32768 # Characters; longest path QueryFullProcessImageNameW can return
+FILETIME_UNIX_EPOCH = 116444736000000000 # 1970-01-01 as a FILETIME (100 ns ticks since 1601)
+PROCESS_INFO_TTL = 1.0 # Seconds the mutable process fields (cwd, status) are reused
+PROCESS_CACHE_SIZE = 256 # PIDs kept by get_process_info; least recently used go first
+
+# --- Direct user32/kernel32 bindings (ctypes) ---
+# Each call is a single foreign-function trampoline with no per-call argument
+# marshalling. Failures are reported through the return value (checked
+# explicitly, so a benign failure costs no exception) and read back with
+# _get_last_error().
+user32 = ctypes.WinDLL("user32", use_last_error=True)
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+user32.IsWindow.argtypes = [wintypes.HWND]
+user32.IsWindow.restype = wintypes.BOOL
+user32.SetWindowPos.argtypes = [wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                ctypes.c_int, ctypes.c_int, wintypes.UINT]
+user32.SetWindowPos.restype = wintypes.BOOL
+user32.GetForegroundWindow.argtypes = []
+user32.GetForegroundWindow.restype = wintypes.HWND
+user32.SetForegroundWindow.argtypes = [wintypes.HWND]
+user32.SetForegroundWindow.restype = wintypes.BOOL
+user32.BringWindowToTop.argtypes = [wintypes.HWND]
+user32.BringWindowToTop.restype = wintypes.BOOL
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+user32.AttachThreadInput.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.BOOL]
+user32.AttachThreadInput.restype = wintypes.BOOL
+user32.BeginDeferWindowPos.argtypes = [ctypes.c_int]
+user32.BeginDeferWindowPos.restype = wintypes.HANDLE
+user32.DeferWindowPos.argtypes = [wintypes.HANDLE, wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+                                  ctypes.c_int, ctypes.c_int, wintypes.UINT]
+user32.DeferWindowPos.restype = wintypes.HANDLE
+user32.EndDeferWindowPos.argtypes = [wintypes.HANDLE]
+user32.EndDeferWindowPos.restype = wintypes.BOOL
+user32.PostMessageW.argtypes = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostMessageW.restype = wintypes.BOOL
+user32.WaitForInputIdle.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+user32.WaitForInputIdle.restype = wintypes.DWORD
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype = wintypes.HANDLE
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype = wintypes.BOOL
+kernel32.QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                ctypes.POINTER(wintypes.DWORD)]
+kernel32.QueryFullProcessImageNameW.restype = wintypes.BOOL
+kernel32.GetProcessTimes.argtypes = [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4
+kernel32.GetProcessTimes.restype = wintypes.BOOL
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+user32.EnumWindows.restype = wintypes.BOOL
+user32.IsWindowVisible.argtypes = [wintypes.HWND]
+user32.IsWindowVisible.restype = wintypes.BOOL
+user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
+user32.GetWindowTextLengthW.restype = ctypes.c_int
+user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowTextW.restype = ctypes.c_int
+user32.SetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPCWSTR]
+user32.SetWindowTextW.restype = wintypes.BOOL
+user32.GetClassNameW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetClassNameW.restype = ctypes.c_int
+user32.GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+user32.GetWindowRect.restype = wintypes.BOOL
+user32.IsIconic.argtypes = [wintypes.HWND]
+user32.IsIconic.restype = wintypes.BOOL
+user32.IsZoomed.argtypes = [wintypes.HWND]
+user32.IsZoomed.restype = wintypes.BOOL
+class WINDOWPLACEMENT(ctypes.Structure):
+    _fields_ = [
+        ("length", wintypes.UINT),
+        ("flags", wintypes.UINT),
+        ("showCmd", wintypes.UINT),
+        ("ptMinPosition", wintypes.POINT),
+        ("ptMaxPosition", wintypes.POINT),
+        ("rcNormalPosition", wintypes.RECT),
+    ]
+
+user32.GetWindowPlacement.argtypes = [wintypes.HWND, ctypes.POINTER(WINDOWPLACEMENT)]
+user32.GetWindowPlacement.restype = wintypes.BOOL
+user32.ShowWindow.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.ShowWindow.restype = wintypes.BOOL
+user32.ShowWindowAsync.argtypes = [wintypes.HWND, ctypes.c_int]
+user32.ShowWindowAsync.restype = wintypes.BOOL
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                  wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+user32.SetWinEventHook.argtypes = [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WINEVENTPROC,
+                                   wintypes.DWORD, wintypes.DWORD, wintypes.DWORD]
+user32.SetWinEventHook.restype = wintypes.HANDLE
+user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+user32.UnhookWinEvent.restype = wintypes.BOOL
+user32.GetMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT]
+user32.GetMessageW.restype = wintypes.BOOL
+user32.PeekMessageW.argtypes = [ctypes.POINTER(wintypes.MSG), wintypes.HWND, wintypes.UINT, wintypes.UINT, wintypes.UINT]
+user32.PeekMessageW.restype = wintypes.BOOL
+user32.PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+user32.PostThreadMessageW.restype = wintypes.BOOL
+kernel32.GetCurrentThreadId.argtypes = []
+kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+kernel32.GetTickCount.argtypes = []
+kernel32.GetTickCount.restype = wintypes.DWORD
+
+
+# Module-level names for every function called below, bound once at import so a
+# call is a single global lookup instead of an attribute lookup on the WinDLL.
+_CloseHandle = kernel32.CloseHandle
+_GetCurrentThreadId = kernel32.GetCurrentThreadId
+_GetProcessTimes = kernel32.GetProcessTimes
+_GetTickCount = kernel32.GetTickCount
+_OpenProcess = kernel32.OpenProcess
+_QueryFullProcessImageNameW = kernel32.QueryFullProcessImageNameW
+_AttachThreadInput = user32.AttachThreadInput
+_BeginDeferWindowPos = user32.BeginDeferWindowPos
+_BringWindowToTop = user32.BringWindowToTop
+_DeferWindowPos = user32.DeferWindowPos
+_EndDeferWindowPos = user32.EndDeferWindowPos
+_GetClassNameW = user32.GetClassNameW
+_GetForegroundWindow = user32.GetForegroundWindow
+_GetMessageW = user32.GetMessageW
+_GetWindowPlacement = user32.GetWindowPlacement
+_GetWindowRect = user32.GetWindowRect
+_GetWindowTextLengthW = user32.GetWindowTextLengthW
+_GetWindowTextW = user32.GetWindowTextW
+_GetWindowThreadProcessId = user32.GetWindowThreadProcessId
+_IsIconic = user32.IsIconic
+_IsWindow = user32.IsWindow
+_IsWindowVisible = user32.IsWindowVisible
+_IsZoomed = user32.IsZoomed
+_PeekMessageW = user32.PeekMessageW
+_PostMessageW = user32.PostMessageW
+_PostThreadMessageW = user32.PostThreadMessageW
+_SetForegroundWindow = user32.SetForegroundWindow
+_SetWinEventHook = user32.SetWinEventHook
+_SetWindowPos = user32.SetWindowPos
+_SetWindowTextW = user32.SetWindowTextW
+_ShowWindow = user32.ShowWindow
+_ShowWindowAsync = user32.ShowWindowAsync
+_UnhookWinEvent = user32.UnhookWinEvent
+_WaitForInputIdle = user32.WaitForInputIdle
+
+# Result of get_window_snapshot(); rect is (left, top, right, bottom), normal_rect
+# is the restored (non-minimized/maximized) rect in workspace coordinates
+WindowSnapshot = namedtuple("WindowSnapshot", ["title", "rect", "class_name", "visible", "minimized", "maximized",
+                                               "normal_rect"])
+
+# WINDOWPLACEMENT.showCmd values of a minimized window
+_MINIMIZED_SHOW_CMDS = frozenset((SW_SHOWMINIMIZED, SW_MINIMIZE, SW_SHOWMINNOACTIVE))
+
+# Per-thread scratch state (reusable ctypes buffers, in_batch/in_hook flags, etc.)
+_tls = threading.local()
+
+# get_process_info cache: pid -> (create_time, fixed fields, mutable fields or None, expiry).
+# Fixed fields come from _fast_process_info plus "username" once psutil has been asked;
+# mutable fields are only fetched (through psutil) for extended results. An LRU
+# bounded to PROCESS_CACHE_SIZE entries, so exited processes do not pile up.
+_proc_cache = OrderedDict()
+_proc_cache_lock = threading.Lock()
+_PROC_BASIC_ATTRS = ["pid", "name", "exe", "create_time"]
+_PROC_MUTABLE_ATTRS = ["cwd", "status"]
+
+# Shared pool for set_window_pos_parallel, created on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+# Foreground tracking (see _track_foreground): the last HWND reported by an
+# EVENT_SYSTEM_FOREGROUND hook, and the hook's (thread, thread id) once
+# installed, or False if it could not be installed.
+_last_foreground_hwnd = 0
+# GetTickCount() of the last switch set_foreground_window recorded itself (None if none)
+_foreground_noted_at = None
+# EVENT_OBJECT_DESTROY hook scoped to the foreground window's thread, as
+# (thread id, hook handle); only touched on the tracker's pump thread
+_destroy_hook = None
+_foreground_hook = None
+_foreground_hook_lock = threading.Lock()
 
 
 # --- Helper Functions ---
 
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared SetWindowPos thread pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=PARALLEL_MAX_WORKERS,
+                                               thread_name_prefix="pywinctl-setpos")
+    return _executor
+
+def _current_tid() -> int:
+    """Return the calling thread's ID, queried once per thread and then kept in _tls."""
+    tid = getattr(_tls, "tid", None)
+    if tid is None:
+        tid = _tls.tid = _GetCurrentThreadId()
+    return tid
+
+def text_buffer():
+    """
+    Return this thread's reusable TEXT_BUFFER_SIZE unicode buffer, creating it on first use.
+    Its contents are only valid until the next *_into call on the same thread.
+    """
+    buf = getattr(_tls, "text_buf", None)
+    if buf is None:
+        buf = _tls.text_buf = ctypes.create_unicode_buffer(TEXT_BUFFER_SIZE)
+    return buf
+
+def _rect_buffer():
+    """
+    Return this thread's reusable RECT and a byref() to it (created on first use),
+    so reading a window rect allocates neither.
+    """
+    entry = getattr(_tls, "rect", None)
+    if entry is None:
+        rect = wintypes.RECT()
+        entry = _tls.rect = (rect, ctypes.byref(rect))
+    return entry
+
+def _placement_buffer():
+    """Return this thread's reusable WINDOWPLACEMENT (length preset) and a byref() to it."""
+    entry = getattr(_tls, "placement", None)
+    if entry is None:
+        placement = WINDOWPLACEMENT()
+        placement.length = ctypes.sizeof(WINDOWPLACEMENT)
+        entry = _tls.placement = (placement, ctypes.byref(placement))
+    return entry
+
 def _check_hwnd(hwnd):
-    """Check if the window handle is valid."""
+    """
+    Cheap sanity check of an HWND argument (type and non-zero only).
+    Whether the window still exists is reported by the API call that follows:
+    it fails with ERROR_INVALID_WINDOW_HANDLE (1400), which every wrapper maps
+    to InvalidWindowError. Skipping a separate IsWindow call halves the
+    syscalls per wrapper.
+    """
     if not isinstance(hwnd, int) or hwnd == 0:
         raise InvalidWindowError(f"Invalid HWND provided: {hwnd}")
-    if not win32gui.IsWindow(hwnd):
-        raise InvalidWindowError(f"Window with HWND {hwnd} does not exist or is invalid.")
 
-def _get_last_error():
-    """Get the last error code from Windows API."""
-    return win32api.GetLastError()
+# Last Windows error code, as saved by ctypes right after each call (use_last_error=True).
+# Bound directly rather than wrapped, so the error path has no extra Python frame.
+_get_last_error = ctypes.get_last_error
+
+def _poll_until(predicate, timeout: float) -> bool:
+    """
+    Call `predicate` about once per millisecond until it returns true or
+    `timeout` seconds pass, so the wait ends as soon as the change happens.
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+def _wait_for_input_idle(pid: int, timeout: float):
+    """Wait (at most `timeout` seconds) until the process is idle waiting for input."""
+    process = _OpenProcess(SYNCHRONIZE | PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not process:
+        return # Not allowed to open it (e.g. elevated); the caller just checks the result
+    try:
+        _WaitForInputIdle(process, int(timeout * 1000))
+    finally:
+        _CloseHandle(process)
 
-def _raise_win_api_error(message, hwnd=None):
-    """Raise a WindowsAPIError with the last error code."""
-    error_code = _get_last_error()
+def _raise_win_api_error(message, hwnd=None, error_code=None):
+    """Raise a WindowsAPIError with the given (or the last) error code."""
+    if error_code is None:
+        error_code = _get_last_error()
     if hwnd is not None:
         message = f"{message} (HWND: {hwnd})"
     raise WindowsAPIError(message, error_code)
 
+# Error codes that get a dedicated exception; any other code becomes a plain WindowsAPIError
+_ERROR_MAP = {
+    ERROR_INVALID_WINDOW_HANDLE: lambda hwnd, code: InvalidWindowError(f"Window with HWND {hwnd} is invalid."),
+    ERROR_ACCESS_DENIED: lambda hwnd, code: WindowsAPIError(
+        f"Access denied trying to control HWND {hwnd}. Try running as administrator.", code),
+}
+
+def _fail(error_code, hwnd, message):
+    """Raise the exception matching a Windows error code (see _ERROR_MAP)."""
+    make_error = _ERROR_MAP.get(error_code)
+    if make_error is not None:
+        raise make_error(hwnd, error_code)
+    _raise_win_api_error(message, hwnd, error_code)
+
+def _raise_ctypes_error(message, hwnd):
+    """
+    Raise the matching exception for a failed ctypes call, using the error code
+    ctypes saved right after the call (use_last_error=True).
+    """
+    _fail(_get_last_error(), hwnd, message)
+
+def _wrap_win32(fn):
+    """
+    Decorator for wrappers taking an HWND first: runs the _check_hwnd() sanity
+    check, so the body is just the API call and its return-value check
+    (failures go through _raise_ctypes_error()).
+    """
+    @functools.wraps(fn)
+    def wrapper(hwnd, *args, **kwargs):
+        _check_hwnd(hwnd)
+        return fn(hwnd, *args, **kwargs)
+    return wrapper
+
+def _start_event_hook(event_min: int, event_max: int, on_event, name: str, on_start=None, on_exit=None):
+    """
+    Install an out-of-context WinEvent hook on a new daemon thread, which pumps
+    messages so the callbacks get delivered. `on_event(event, hwnd, id_object, id_child, event_time)`
+    runs on that thread, as do the optional `on_start()` (once the hook is
+    live) and `on_exit()` (before it is removed), e.g. to manage further
+    hooks, which must be removed by the thread that installed them.
+    Stop it with _stop_event_hook().
+
+    Returns:
+        (thread, thread_id) of the pump thread.
+    """
+    ready = threading.Event()
+    state = {"thread_id": 0, "hook": None, "error": 0, "exception": None}
+
+    def _on_event(_hook, event, event_hwnd, id_object, id_child, _event_thread, event_time):
+        _tls.in_hook = True # Lets re-entrant pywinctl calls avoid the thread pool
+        try:
+            on_event(event, event_hwnd or 0, id_object, id_child, event_time)
+        finally:
+            _tls.in_hook = False
+
+    callback = WINEVENTPROC(_on_event) # Must stay referenced while the hook is installed
+
+    def _pump():
+        try:
+            msg = wintypes.MSG()
+            # Force creation of this thread's message queue so WM_QUIT can be posted to it
+            _PeekMessageW(ctypes.byref(msg), None, 0, 0, PM_NOREMOVE)
+            state["thread_id"] = _GetCurrentThreadId()
+            hook = _SetWinEventHook(event_min, event_max, None, callback, 0, 0, WINEVENT_OUTOFCONTEXT)
+            if not hook:
+                state["error"] = _get_last_error()
+                return
+            try:
+                if on_start is not None:
+                    on_start()
+                state["hook"] = hook
+                ready.set()
+                while _GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                    pass
+            finally:
+                if on_exit is not None:
+                    on_exit()
+                _UnhookWinEvent(hook)
+        except Exception as e:
+            state["exception"] = e # Reported by the starting thread if the hook never went live
+        finally:
+            ready.set() # Whatever failed, never leave the caller waiting
+
+    thread = threading.Thread(target=_pump, name=name, daemon=True)
+    thread.start()
+    ready.wait()
+    if not state["hook"]:
+        thread.join()
+        if state["exception"] is not None:
+            raise WindowsAPIError(f"Failed to start WinEvent hook: {state['exception']}") from state["exception"]
+        raise WindowsAPIError("Failed to install WinEvent hook", state["error"])
+    return thread, state["thread_id"]
+
+def _stop_event_hook(hook):
+    """Unhook and end a pump thread started by _start_event_hook()."""
+    thread, thread_id = hook
+    _PostThreadMessageW(thread_id, WM_QUIT, 0, 0)
+    if thread is not threading.current_thread(): # Called from one of its own callbacks
+        thread.join()
+
+def _note_foreground(hwnd: int):
+    """
+    Record a foreground switch set_foreground_window has just confirmed, so the
+    cache is right immediately instead of once the hook's event arrives.
+    """
+    global _last_foreground_hwnd, _foreground_noted_at
+    _foreground_noted_at = _GetTickCount()
+    _last_foreground_hwnd = hwnd
+
+def _on_foreground_destroyed(_hook, _event, hwnd, id_object, id_child, _event_thread, _event_time):
+    global _last_foreground_hwnd
+    _tls.in_hook = True # Lets re-entrant pywinctl calls avoid the thread pool
+    try:
+        if (id_object == OBJID_WINDOW and id_child == CHILDID_SELF
+                and hwnd and hwnd == _last_foreground_hwnd):
+            _last_foreground_hwnd = 0 # No longer valid; callers ask GetForegroundWindow until the next switch
+    finally:
+        _tls.in_hook = False
+
+_FOREGROUND_DESTROY_PROC = WINEVENTPROC(_on_foreground_destroyed)
+
+def _scope_destroy_hook(hwnd: int):
+    """
+    Point the EVENT_OBJECT_DESTROY hook at the thread owning `hwnd` (normally the
+    foreground window), so only that thread's destroy events are delivered rather
+    than every object destroyed on the desktop. Runs on the tracker's pump thread.
+    """
+    global _destroy_hook
+    pid = wintypes.DWORD()
+    thread_id = _GetWindowThreadProcessId(hwnd, ctypes.byref(pid)) if hwnd else 0
+    if _destroy_hook is not None:
+        if _destroy_hook[0] == thread_id:
+            return
+        _UnhookWinEvent(_destroy_hook[1])
+        _destroy_hook = None
+    if thread_id:
+        handle = _SetWinEventHook(EVENT_OBJECT_DESTROY, EVENT_OBJECT_DESTROY, None, _FOREGROUND_DESTROY_PROC,
+                                  pid.value, thread_id, WINEVENT_OUTOFCONTEXT)
+        if handle:
+            _destroy_hook = (thread_id, handle)
+
+def _start_tracking():
+    global _last_foreground_hwnd
+    # Seeded after the hook is live so a change in between is not missed
+    _last_foreground_hwnd = _GetForegroundWindow() or 0
+    _scope_destroy_hook(_last_foreground_hwnd)
+
+def _stop_tracking():
+    _scope_destroy_hook(0)
+
+def _on_foreground_event(_event, hwnd, _id_object, _id_child, event_time):
+    global _last_foreground_hwnd
+    noted_at = _foreground_noted_at
+    # Events are delivered late: one generated before a switch that
+    # _note_foreground() already recorded would roll the cache back to an older
+    # window. Tick counts wrap, so compare the difference modulo 2**32.
+    # GetTickCount only advances every ~16 ms, so events from the same tick are
+    # kept: they arrive in order, so our own switch's event still comes after
+    # any stale one, and a real switch right after ours (e.g. to an owned
+    # dialog) is not lost.
+    age = (event_time - noted_at) & 0xFFFFFFFF if noted_at is not None else 0
+    if age < 0x80000000:
+        _last_foreground_hwnd = hwnd # A single rebind, atomic under the GIL
+    # Events arrive in order, so the last one names the actual foreground window
+    _scope_destroy_hook(hwnd)
+
+def _track_foreground() -> bool:
+    """
+    Keep _last_foreground_hwnd current via an EVENT_SYSTEM_FOREGROUND hook
+    (plus an EVENT_OBJECT_DESTROY hook on the foreground window's thread, which
+    resets it to 0 when that window is destroyed), installing them on first
+    call. Afterwards this is a single global read.
+
+    Returns:
+        True if the hook is live, False if it could not be installed (callers
+        then ask GetForegroundWindow directly).
+    """
+    global _foreground_hook
+    if _foreground_hook is None:
+        with _foreground_hook_lock:
+            if _foreground_hook is None:
+                try:
+                    hook = _start_event_hook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+                                             _on_foreground_event, "pywinctl-foreground-tracker",
+                                             on_start=_start_tracking, on_exit=_stop_tracking)
+                except WindowsAPIError as e:
+                    logger.warning("Foreground tracking unavailable, using GetForegroundWindow: %s", e)
+                    hook = False
+                _foreground_hook = hook
+    return bool(_foreground_hook)
+
+def is_window(hwnd: int) -> bool:
+    """Check whether the HWND identifies an existing window."""
+    return bool(hwnd) and bool(_IsWindow(hwnd))
+
 
 # --- Core API Wrappers ---
 
+@_wrap_win32
 def set_window_pos(hwnd: int, x: int, y: int, width: int, height: int):
     """Move and resize a window using SetWindowPos."""
-    _check_hwnd(hwnd)
+    # Flags: Don't change Z-order, don't activate
+    flags = SWP_NOZORDER | SWP_NOACTIVATE
+    if not _SetWindowPos(hwnd, None, x, y, width, height, flags):
+        _raise_ctypes_error(f"Failed to set window position/size for HWND {hwnd}", hwnd)
+
+def set_window_pos_batch(items):
+    """
+    Move and resize several windows at once with BeginDeferWindowPos /
+    DeferWindowPos / EndDeferWindowPos, so the system applies all changes in a
+    single pass instead of one repositioning cycle per window.
+
+    Args:
+        items: Iterable of (hwnd, x, y, width, height) tuples.
+    """
+    items = [tuple(item) for item in items]
+    if not items:
+        return
+    for item in items:
+        _check_hwnd(item[0])
+    # Flags: Don't change Z-order, don't activate
+    flags = SWP_NOZORDER | SWP_NOACTIVATE
+    if getattr(_tls, "in_batch", False):
+        # Re-entered while this thread is building a batch (e.g. from a hook
+        # callback): apply directly rather than nesting a second deferred batch.
+        for hwnd, x, y, width, height in items:
+            set_window_pos(hwnd, x, y, width, height)
+        return
+    _tls.in_batch = True
+    try:
+        hdwp = _BeginDeferWindowPos(len(items))
+        if not hdwp:
+            _raise_win_api_error("Failed to begin batched window positioning")
+        for hwnd, x, y, width, height in items:
+            hdwp = _DeferWindowPos(hdwp, hwnd, None, x, y, width, height, flags)
+            if not hdwp:
+                # The system discards the whole batch when DeferWindowPos fails
+                _raise_ctypes_error(f"Failed to queue window position/size for HWND {hwnd}", hwnd)
+        if not _EndDeferWindowPos(hdwp):
+            _raise_win_api_error("Failed to apply batched window positions")
+    finally:
+        _tls.in_batch = False
+
+def set_window_pos_parallel(items):
+    """
+    Move and resize several windows by issuing their SetWindowPos calls from a
+    thread pool. SetWindowPos blocks until the owning thread processes the
+    resulting messages, so windows owned by different threads/processes are
+    repositioned concurrently instead of waiting on each message pump in turn.
+
+    Falls back to set_window_pos_batch() for fewer than PARALLEL_MIN_ITEMS
+    windows and when called from inside a pywinctl hook callback or batch.
+    Windows owned by the calling thread are handled on it, since a pool thread
+    would block on this (waiting) thread's message queue.
+
+    Args:
+        items: Iterable of (hwnd, x, y, width, height) tuples.
+
+    Raises:
+        The first error, in item order, after all calls have completed.
+    """
+    items = [tuple(item) for item in items]
+    if (len(items) < PARALLEL_MIN_ITEMS or getattr(_tls, "in_hook", False)
+            or getattr(_tls, "in_batch", False)):
+        set_window_pos_batch(items)
+        return
+    for item in items:
+        _check_hwnd(item[0])
+    current_thread_id = _current_tid()
+    executor = _get_executor()
+    futures = []
+    local_items = []
+    for item in items:
+        if _GetWindowThreadProcessId(item[0], None) == current_thread_id:
+            local_items.append(item)
+        else:
+            futures.append(executor.submit(set_window_pos, *item))
     try:
-        # Flags: Don't change Z-order, don't activate
-        flags = SWP_NOZORDER | SWP_NOACTIVATE
-        win32gui.SetWindowPos(hwnd, 0, x, y, width, height, flags)
-    except pywintypes.error as e:
-        # Error code 1400: Invalid window handle (often means window closed)
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid (possibly closed).") from e
-        _raise_win_api_error(f"Failed to set window position/size for HWND {hwnd}", hwnd)
+        for hwnd, x, y, width, height in local_items:
+            set_window_pos(hwnd, x, y, width, height)
+    finally:
+        wait(futures)
+    for future in futures:
+        future.result() # Re-raises the first failure
 
+@_wrap_win32
 def move_window(hwnd: int, x: int, y: int):
     """Move a window without changing its size or Z-order."""
-    _check_hwnd(hwnd)
-    try:
-        # Flags: Don't change size, don't change Z-order, don't activate
-        flags = SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE
-        win32gui.SetWindowPos(hwnd, 0, x, y, 0, 0, flags)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to move window for HWND {hwnd}", hwnd)
+    # Flags: Don't change size, don't change Z-order, don't activate
+    flags = SWP_NOSIZE | SWP_NOZORDER | SWP_NOACTIVATE
+    if not _SetWindowPos(hwnd, None, x, y, 0, 0, flags):
+        _raise_ctypes_error(f"Failed to move window for HWND {hwnd}", hwnd)
 
+@_wrap_win32
 def resize_window(hwnd: int, width: int, height: int):
     """Resize a window without moving it or changing its Z-order."""
-    _check_hwnd(hwnd)
-    try:
-        # Flags: Don't move, don't change Z-order, don't activate
-        flags = SWP_NOMOVE | SWP_NOZORDER | SWP_NOACTIVATE
-        win32gui.SetWindowPos(hwnd, 0, 0, 0, width, height, flags)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to resize window for HWND {hwnd}", hwnd)
+    # Flags: Don't move, don't change Z-order, don't activate
+    flags = SWP_NOMOVE | SWP_NOZORDER | SWP_NOACTIVATE
+    if not _SetWindowPos(hwnd, None, 0, 0, width, height, flags):
+        _raise_ctypes_error(f"Failed to resize window for HWND {hwnd}", hwnd)
 
+@_wrap_win32
 def show_window(hwnd: int, command: int):
     """Show, hide, minimize, maximize, or restore a window."""
-    _check_hwnd(hwnd)
-    try:
-        # Use ShowWindowAsync for potentially better responsiveness with unresponsive apps
-        # Fallback to ShowWindow if ShowWindowAsync isn't readily available or fails
-        try:
-            win32gui.ShowWindowAsync(hwnd, command)
-        except AttributeError: # If ShowWindowAsync isn't in the pywin32 version
-             if not win32gui.ShowWindow(hwnd, command):
-                 # ShowWindow returns 0 if it was previously hidden, non-zero otherwise
-                 # Check IsWindowVisible to confirm success, especially for SW_SHOW
-                 if command == win32con.SW_SHOW and not win32gui.IsWindowVisible(hwnd):
-                     time.sleep(0.1) # Give it a moment
-                     if not win32gui.IsWindowVisible(hwnd):
-                          _raise_win_api_error(f"Failed to show window command {command} for HWND {hwnd}", hwnd)
-
-    except pywintypes.error as e:
-         if e.winerror == 1400:
-             raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-         # Error 5: Access Denied (might happen with elevated windows)
-         if e.winerror == 5:
-             raise WindowsAPIError(f"Access denied trying to control HWND {hwnd}. Try running script as administrator.", e.winerror)
-         _raise_win_api_error(f"Failed window command {command} for HWND {hwnd}", hwnd)
+    if command == SW_HIDE and _GetWindowThreadProcessId(hwnd, None) == _current_tid():
+        # Our own window: hiding completes synchronously without a visible delay, so
+        # skip the message ShowWindowAsync posts to itself. Another thread's window
+        # would make ShowWindow wait on its (possibly hung) message loop, so those
+        # still go through ShowWindowAsync below. ShowWindow returns the previous
+        # visibility rather than success; failure shows in the last error.
+        ctypes.set_last_error(0)
+        if not _ShowWindow(hwnd, command) and _get_last_error():
+            _raise_ctypes_error(f"Failed window command {command} for HWND {hwnd}", hwnd)
+        return
+    # Use ShowWindowAsync for potentially better responsiveness with unresponsive apps
+    if not _ShowWindowAsync(hwnd, command):
+        _raise_ctypes_error(f"Failed window command {command} for HWND {hwnd}", hwnd)
 
 def minimize(hwnd: int):
-    show_window(hwnd, win32con.SW_MINIMIZE)
+    show_window(hwnd, SW_MINIMIZE)
 
 def maximize(hwnd: int):
-    show_window(hwnd, win32con.SW_MAXIMIZE)
+    show_window(hwnd, SW_MAXIMIZE)
 
 def restore(hwnd: int):
-    show_window(hwnd, win32con.SW_RESTORE)
+    show_window(hwnd, SW_RESTORE)
 
 def hide(hwnd: int):
-     show_window(hwnd, win32con.SW_HIDE)
+     show_window(hwnd, SW_HIDE)
 
 def show(hwnd: int):
-     show_window(hwnd, win32con.SW_SHOW)
+     show_window(hwnd, SW_SHOW)
 
 
+@_wrap_win32
 def close_window(hwnd: int):
     """Close a window by sending WM_CLOSE."""
-    _check_hwnd(hwnd)
-    try:
-        win32api.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
+    if not _PostMessageW(hwnd, WM_CLOSE, 0, 0):
+        error_code = _get_last_error()
+        if error_code == ERROR_INVALID_WINDOW_HANDLE:
              # Window might already be closed, which is fine for a close operation
              return
-        _raise_win_api_error(f"Failed to send WM_CLOSE to HWND {hwnd}", hwnd)
+        _raise_win_api_error(f"Failed to send WM_CLOSE to HWND {hwnd}", hwnd, error_code)
 
 
-def set_foreground_window(hwnd: int):
-    """Bring a window to the foreground."""
-    _check_hwnd(hwnd)
+@_wrap_win32
+def set_foreground_window(hwnd: int, timeout: float = FOREGROUND_WAIT):
+    """
+    Bring a window to the foreground.
+
+    Args:
+        timeout: Max seconds to wait for the switch to complete before (and after)
+            the BringWindowToTop fallback. The wait ends as soon as it happens.
+    """
+    # Avoid any syscalls if the cache says it already is the foreground window
+    if _track_foreground() and hwnd == _last_foreground_hwnd:
+        return
     try:
-        # Simple SetForegroundWindow often fails due to restrictions.
-        # A common workaround:
+        # Simple SetForegroundWindow works whenever the foreground lock allows it
+        # (e.g. this process owns the foreground), so try it first. Minimized
+        # windows skip this: activating one does not restore it.
+        if not _IsIconic(hwnd):
+            _SetForegroundWindow(hwnd)
+            current_foreground_hwnd = _GetForegroundWindow() or 0 # NULL comes back as None
+            if hwnd == current_foreground_hwnd:
+                _note_foreground(hwnd)
+                return
+        else:
+            # Asked fresh: a lagging cached value would attach the wrong thread
+            current_foreground_hwnd = _GetForegroundWindow() or 0
+
+        # Otherwise it failed due to restrictions. A common workaround:
         # 1. Get the current foreground window's thread ID.
         # 2. Get the target window's thread ID.
         # 3. Attach the input processing mechanism of the two threads.
@@ -158,197 +704,359 @@ def set_foreground_window(hwnd: int):
         # 5. Set the foreground window.
         # 6. Detach the thread inputs.
 
-        target_thread_id, _ = win32process.GetWindowThreadProcessId(hwnd)
-        current_foreground_hwnd = win32gui.GetForegroundWindow()
-
-        # Avoid unnecessary operations if already foreground
-        if hwnd == current_foreground_hwnd:
-            return
+        target_pid = wintypes.DWORD()
+        target_thread_id = _GetWindowThreadProcessId(hwnd, ctypes.byref(target_pid))
+        if not target_thread_id:
+            _raise_ctypes_error(f"Failed to set foreground window for HWND {hwnd}", hwnd)
 
-        current_thread_id = win32api.GetCurrentThreadId()
-        foreground_thread_id, _ = win32process.GetWindowThreadProcessId(current_foreground_hwnd)
+        current_thread_id = _current_tid()
+        foreground_thread_id = _GetWindowThreadProcessId(current_foreground_hwnd, None)
 
-        # Attach threads
-        win32process.AttachThreadInput(foreground_thread_id, current_thread_id, True)
-        win32process.AttachThreadInput(target_thread_id, current_thread_id, True)
+        # Attach threads. A thread already shares its own input queue, so the attach
+        # is skipped for windows owned by this thread (e.g. an app driving its own
+        # windows) and when there is no foreground window at all.
+        attached = [thread_id for thread_id in {foreground_thread_id, target_thread_id}
+                    if thread_id and thread_id != current_thread_id]
+        for thread_id in attached:
+            _AttachThreadInput(thread_id, current_thread_id, True)
 
         try:
             # Restore if minimized and bring to top
-            if win32gui.IsIconic(hwnd):
-                show_window(hwnd, win32con.SW_RESTORE)
+            if _IsIconic(hwnd):
+                show_window(hwnd, SW_RESTORE)
             else:
                  # Bring window to top without activating immediately
-                win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, 0, 0, 0, 0,
-                                      SWP_NOSIZE | SWP_NOMOVE | SWP_NOACTIVATE)
+                _SetWindowPos(hwnd, HWND_TOP, 0, 0, 0, 0,
+                              SWP_NOSIZE | SWP_NOMOVE | SWP_NOACTIVATE)
 
 
             # Attempt to set foreground
-            win32gui.SetForegroundWindow(hwnd)
-            # Check if successful after a short delay
-            time.sleep(0.05)
-            if win32gui.GetForegroundWindow() != hwnd:
+            _SetForegroundWindow(hwnd)
+            # Let the target process handle the activation instead of sleeping a fixed time
+            _wait_for_input_idle(target_pid.value, timeout)
+            if _GetForegroundWindow() == hwnd:
+                _note_foreground(hwnd)
+            else:
                 # Fallback: Try bringing to top again, might work in some cases
-                 win32gui.BringWindowToTop(hwnd)
-                 time.sleep(0.05)
-                 # Final check
-                 if win32gui.GetForegroundWindow() != hwnd:
-                      print(f"Warning: Failed to reliably set HWND {hwnd} to foreground.")
+                 _BringWindowToTop(hwnd)
+                 # Final check, returning as soon as it succeeds
+                 if _poll_until(lambda: _GetForegroundWindow() == hwnd, timeout):
+                      _note_foreground(hwnd)
+                 else:
+                      logger.warning("Failed to reliably set HWND %s to foreground.", hwnd)
 
 
         finally:
             # Detach threads
-            win32process.AttachThreadInput(target_thread_id, current_thread_id, False)
-            win32process.AttachThreadInput(foreground_thread_id, current_thread_id, False)
-
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        if e.winerror == 5: # Access Denied
-             raise WindowsAPIError(f"Access denied trying to set foreground HWND {hwnd}. Try running as administrator.", e.winerror)
-        _raise_win_api_error(f"Failed to set foreground window for HWND {hwnd}", hwnd)
+            for thread_id in attached:
+                _AttachThreadInput(thread_id, current_thread_id, False)
+
+    except (InvalidWindowError, WindowsAPIError):
+        raise
     except Exception as e:
         # Catch potential errors during thread attachment/detachment
         raise WindowsAPIError(f"An unexpected error occurred during set_foreground_window for HWND {hwnd}: {e}")
 
 
+@_wrap_win32
 def set_window_title(hwnd: int, title: str):
-    """Set the title text of a window."""
-    _check_hwnd(hwnd)
-    try:
-        result = win32gui.SetWindowText(hwnd, title)
-        if result == 0: # SetWindowText returns 0 on failure
-             last_error = _get_last_error()
-             # Error 1400 likely means window closed between check and call
-             if last_error != 0 and last_error != 1400:
-                 raise WindowsAPIError(f"Failed to set window title for HWND {hwnd}", last_error)
-             elif last_error == 1400:
-                 raise InvalidWindowError(f"Window with HWND {hwnd} became invalid during title set.")
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to set window title for HWND {hwnd}", hwnd)
+    """Set the title text of a window (passed to SetWindowTextW as UTF-16, no ANSI round trip)."""
+    if not _SetWindowTextW(hwnd, title):
+        _raise_ctypes_error(f"Failed to set window title for HWND {hwnd}", hwnd)
 
 def get_window_title(hwnd: int) -> str:
-     """Get the title text of a window."""
-     _check_hwnd(hwnd)
-     try:
-         return win32gui.GetWindowText(hwnd)
-     except pywintypes.error as e:
-        if e.winerror == 1400:
-             raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to get window title for HWND {hwnd}", hwnd)
+    """Get the title text of a window (via this thread's reusable buffer)."""
+    return get_window_title_into(hwnd, text_buffer())
+
+@_wrap_win32
+def get_window_title_into(hwnd: int, buf) -> str:
+    """
+    Get the title text of a window, reading it into a caller-supplied unicode buffer
+    (see text_buffer()) instead of allocating a new one.
+    """
+    size = len(buf)
+    if _GetWindowTextW(hwnd, buf, size) < size - 1:
+        return buf.value
+    # Possibly truncated: read again into a buffer sized to the actual length
+    length = _GetWindowTextLengthW(hwnd)
+    long_buf = ctypes.create_unicode_buffer(length + 1)
+    _GetWindowTextW(hwnd, long_buf, length + 1)
+    return long_buf.value
 
+@_wrap_win32
 def get_window_rect(hwnd: int) -> tuple[int, int, int, int]:
     """Get the window's bounding rectangle (left, top, right, bottom)."""
-    _check_hwnd(hwnd)
-    try:
-        return win32gui.GetWindowRect(hwnd)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-             raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to get window rect for HWND {hwnd}", hwnd)
+    rect, rect_ref = _rect_buffer()
+    if not _GetWindowRect(hwnd, rect_ref):
+        _raise_ctypes_error(f"Failed to get window rect for HWND {hwnd}", hwnd)
+    return (rect.left, rect.top, rect.right, rect.bottom)
 
+def get_window_rect_into(hwnds, out) -> list[int]:
+    """
+    Read the rects of many windows into a caller-supplied flat buffer, e.g.
+    `array.array('l', [0] * 4 * len(hwnds))`: window i's (left, top, right, bottom)
+    is written to out[4*i : 4*i + 4]. No tuple is built per window.
+
+    Returns:
+        Indices of the HWNDs whose rect could not be read (e.g. closed in the
+        meantime); their slots are set to 0.
+    """
+    rect, rect_ref = _rect_buffer()
+    failed = []
+    for i, hwnd in enumerate(hwnds):
+        base = 4 * i
+        if hwnd and _GetWindowRect(hwnd, rect_ref):
+            out[base] = rect.left
+            out[base + 1] = rect.top
+            out[base + 2] = rect.right
+            out[base + 3] = rect.bottom
+        else:
+            out[base] = out[base + 1] = out[base + 2] = out[base + 3] = 0
+            failed.append(i)
+    return failed
+
+@_wrap_win32
+def get_window_snapshot(hwnd: int) -> WindowSnapshot:
+    """
+    Read title, rect, class name, visible/minimized/maximized state and the
+    restored rect in one pass, calling user32 directly and reusing this thread's
+    buffers. A single GetWindowPlacement answers minimized, maximized and the
+    restored rect. Much cheaper than the individual wrappers when inspecting
+    many windows.
+    """
+    rect, rect_ref = _rect_buffer()
+    if not _GetWindowRect(hwnd, rect_ref):
+        _raise_ctypes_error(f"Failed to get window rect for HWND {hwnd}", hwnd)
+    placement, placement_ref = _placement_buffer()
+    if not _GetWindowPlacement(hwnd, placement_ref):
+        _raise_ctypes_error(f"Failed to get window placement for HWND {hwnd}", hwnd)
+    normal = placement.rcNormalPosition
+    buf = text_buffer()
+    title = get_window_title_into(hwnd, buf)
+    class_name = buf.value if _GetClassNameW(hwnd, buf, len(buf)) else ""
+    return WindowSnapshot(
+        title,
+        (rect.left, rect.top, rect.right, rect.bottom),
+        class_name,
+        bool(_IsWindowVisible(hwnd)),
+        placement.showCmd in _MINIMIZED_SHOW_CMDS,
+        placement.showCmd == SW_MAXIMIZE,
+        (normal.left, normal.top, normal.right, normal.bottom),
+    )
+
+@_wrap_win32
 def get_window_thread_process_id(hwnd: int) -> tuple[int, int]:
     """Get the thread ID and process ID (PID) of the window's creator."""
-    _check_hwnd(hwnd)
+    pid = wintypes.DWORD()
+    thread_id = _GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    if not thread_id:
+        _raise_ctypes_error(f"Failed to get thread/process ID for HWND {hwnd}", hwnd)
+    return thread_id, pid.value
+
+def _fast_process_info(pid: int) -> dict:
+    """
+    Get pid/name/exe/create_time of a process without psutil: one
+    PROCESS_QUERY_LIMITED_INFORMATION handle serves QueryFullProcessImageNameW
+    and GetProcessTimes.
+
+    Raises:
+        WindowsAPIError: ERROR_INVALID_PARAMETER if there is no such process,
+            ERROR_ACCESS_DENIED if it cannot be queried.
+    """
+    process = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not process:
+        _raise_win_api_error(f"Failed to open process PID {pid}")
     try:
-        return win32process.GetWindowThreadProcessId(hwnd)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to get thread/process ID for HWND {hwnd}", hwnd)
-
-def get_process_info(pid: int) -> dict:
-    """Get information about a process using psutil (if available)."""
-    if psutil is None:
-        return {"error": "psutil library not installed"}
+        buf = text_buffer()
+        size = wintypes.DWORD(len(buf))
+        if not _QueryFullProcessImageNameW(process, 0, buf, ctypes.byref(size)):
+            if _get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+                _raise_win_api_error(f"Failed to get image name of PID {pid}")
+            buf = ctypes.create_unicode_buffer(MAX_LONG_PATH)
+            size = wintypes.DWORD(len(buf))
+            if not _QueryFullProcessImageNameW(process, 0, buf, ctypes.byref(size)):
+                _raise_win_api_error(f"Failed to get image name of PID {pid}")
+        exe = buf.value
+        creation, exit_time, kernel_time, user_time = (wintypes.FILETIME() for _ in range(4))
+        if not _GetProcessTimes(process, ctypes.byref(creation), ctypes.byref(exit_time),
+                                ctypes.byref(kernel_time), ctypes.byref(user_time)):
+            _raise_win_api_error(f"Failed to get times of PID {pid}")
+    finally:
+        _CloseHandle(process)
+    ticks = (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+    return {
+        "pid": pid,
+        "name": os.path.basename(exe),
+        "exe": exe,
+        "create_time": (ticks - FILETIME_UNIX_EPOCH) / 1e7, # Seconds since the epoch, like psutil
+    }
+
+def _merge_process_info(entry, extended: bool) -> dict:
+    """Build a fresh get_process_info() result dict from a _proc_cache entry."""
+    _, fixed, mutable, _ = entry
+    if not extended:
+        return {name: fixed[name] for name in _PROC_BASIC_ATTRS}
+    return {
+        "pid": fixed["pid"],
+        "name": fixed["name"],
+        "exe": fixed["exe"],
+        "cwd": mutable["cwd"],
+        "username": fixed["username"],
+        "create_time": fixed["create_time"],
+        "status": mutable["status"],
+    }
+
+def _forget_process_info(pid: int):
+    """Drop a PID from _proc_cache (the process is gone)."""
+    with _proc_cache_lock:
+        _proc_cache.pop(pid, None)
+
+def get_process_info(pid: int, extended: bool = True) -> dict:
+    """
+    Get information about a process.
+
+    pid/name/exe/create_time are read directly (see _fast_process_info). With
+    `extended`, username/cwd/status are added using psutil (if available;
+    None otherwise). Results are cached per PID (up to PROCESS_CACHE_SIZE of
+    them) for PROCESS_INFO_TTL seconds. After that the direct fields are read
+    again in full (create_time also detects PID reuse), while username, once
+    psutil has found it, is kept for the lifetime of the process.
+    """
+    now = time.monotonic()
+    with _proc_cache_lock:
+        entry = _proc_cache.get(pid)
+        if entry is not None:
+            _proc_cache.move_to_end(pid)
+    if entry is not None and now < entry[3] and (entry[2] is not None or not extended):
+        return _merge_process_info(entry, extended) # Fresh enough: no cross-process query at all
     try:
-        proc = psutil.Process(pid)
-        return {
-            "pid": proc.pid,
-            "name": proc.name(),
-            "exe": proc.exe(),
-            "cwd": proc.cwd(),
-            "username": proc.username(),
-            "create_time": proc.create_time(),
-            "status": proc.status(),
-        }
-    except psutil.NoSuchProcess:
-        return {"error": f"Process with PID {pid} not found"}
-    except psutil.AccessDenied:
-        return {"error": f"Access denied to process PID {pid}"}
+        info = _fast_process_info(pid)
+        if entry is not None and entry[0] == info["create_time"]:
+            fixed = entry[1] # Same process: keep the username psutil already found
+        else:
+            fixed = info # First sighting, or the PID was reused by a new process
+        mutable = None
+        if extended:
+            attrs = _PROC_MUTABLE_ATTRS if "username" in fixed else ["username"] + _PROC_MUTABLE_ATTRS
+            psutil = _lazy.psutil() # Optional; imported on first use
+            if psutil is None:
+                extra = dict.fromkeys(attrs)
+            else:
+                try:
+                    # A single as_dict() (one process attach); denied fields come back as None
+                    extra = psutil.Process(pid).as_dict(attrs=attrs)
+                except psutil.NoSuchProcess:
+                    _forget_process_info(pid)
+                    return {"error": f"Process with PID {pid} not found"}
+            if "username" not in fixed:
+                fixed = dict(fixed, username=extra["username"])
+            mutable = {name: extra[name] for name in _PROC_MUTABLE_ATTRS}
+        entry = (fixed["create_time"], fixed, mutable, now + PROCESS_INFO_TTL)
+        with _proc_cache_lock:
+            _proc_cache[pid] = entry
+            _proc_cache.move_to_end(pid)
+            if len(_proc_cache) > PROCESS_CACHE_SIZE:
+                _proc_cache.popitem(last=False)
+        return _merge_process_info(entry, extended)
+    except WindowsAPIError as e:
+        if e.error_code == ERROR_INVALID_PARAMETER:
+            _forget_process_info(pid)
+            return {"error": f"Process with PID {pid} not found"}
+        if e.error_code == ERROR_ACCESS_DENIED:
+            return {"error": f"Access denied to process PID {pid}"}
+        return {"error": f"Failed to get info for PID {pid}: {e}"}
     except Exception as e:
         return {"error": f"Failed to get info for PID {pid}: {e}"}
 
 
+@_wrap_win32
 def set_always_on_top(hwnd: int, enable: bool = True):
     """Set the window's always-on-top status."""
-    _check_hwnd(hwnd)
-    try:
-        z_order = HWND_TOPMOST if enable else HWND_NOTOPMOST
-        # Flags: Keep current position and size
-        flags = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE
-        win32gui.SetWindowPos(hwnd, z_order, 0, 0, 0, 0, flags)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        if e.winerror == 5: # Access Denied
-             raise WindowsAPIError(f"Access denied trying to set always-on-top for HWND {hwnd}. Try running as administrator.", e.winerror)
-        _raise_win_api_error(f"Failed to set always-on-top for HWND {hwnd}", hwnd)
+    z_order = HWND_TOPMOST if enable else HWND_NOTOPMOST
+    # Flags: Keep current position and size
+    flags = SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE
+    if not _SetWindowPos(hwnd, z_order, 0, 0, 0, 0, flags):
+        _raise_ctypes_error(f"Failed to set always-on-top for HWND {hwnd}", hwnd)
 
+@_wrap_win32
 def is_window_visible(hwnd: int) -> bool:
-    """Check if the window is visible."""
-    _check_hwnd(hwnd)
-    try:
-        return bool(win32gui.IsWindowVisible(hwnd))
-    except pywintypes.error as e:
-         if e.winerror == 1400:
-             # If handle is invalid, it's not visible
-             return False
-         _raise_win_api_error(f"Failed to check visibility for HWND {hwnd}", hwnd)
+    """Check if the window is visible (False for an invalid handle)."""
+    return bool(_IsWindowVisible(hwnd))
 
+@_wrap_win32
 def is_minimized(hwnd: int) -> bool:
-    """Check if the window is minimized (iconic)."""
-    _check_hwnd(hwnd)
-    try:
-        return bool(win32gui.IsIconic(hwnd))
-    except pywintypes.error as e:
-         if e.winerror == 1400:
-             # If handle is invalid, consider it not minimized in a functional sense
-             return False
-         _raise_win_api_error(f"Failed to check minimized state for HWND {hwnd}", hwnd)
+    """Check if the window is minimized (iconic). False for an invalid handle."""
+    return bool(_IsIconic(hwnd))
 
+@_wrap_win32
 def is_maximized(hwnd: int) -> bool:
-    """Check if the window is maximized."""
-    _check_hwnd(hwnd)
-    try:
-        # GetWindowPlacement returns tuple: (flags, showCmd, ptMinPosition, ptMaxPosition, rcNormalPosition)
-        # We need the 'showCmd' value which is at index 1.
-        placement = win32gui.GetWindowPlacement(hwnd)
-        return placement[1] == win32con.SW_MAXIMIZE
-    except pywintypes.error as e:
-         if e.winerror == 1400: # Error 1400: Invalid window handle
-             # If handle is invalid, it's certainly not maximized
-             return False
-         # Use _raise_win_api_error for other API errors
-         _raise_win_api_error(f"Failed to get window placement for HWND {hwnd} while checking maximized state", hwnd)
-    except Exception as e:
-        # Catch any other unexpected errors during the check
-         raise WindowsAPIError(f"An unexpected error occurred checking maximized state for HWND {hwnd}: {e}")
+    """Check if the window is maximized (zoomed). False for an invalid handle."""
+    return bool(_IsZoomed(hwnd))
 
 def get_active_window_hwnd() -> int:
-    """Get the HWND of the currently active foreground window."""
+    """
+    Get the HWND of the currently active foreground window (0 if there is none).
+    Served from the foreground hook's cache (see _track_foreground) when it is live;
+    switches made by set_foreground_window are reflected at once, others once
+    the system has delivered their event.
+    """
+    if _track_foreground() and _last_foreground_hwnd:
+        return _last_foreground_hwnd
+    # No hook, or the cached foreground window was destroyed: ask the system
+    return _GetForegroundWindow() or 0 # NULL comes back as None
+
+def shutdown():
+    """
+    Remove the foreground hook (see _track_foreground) and stop its pump thread.
+    Safe to call more than once; the hook is installed again by the next call
+    that needs it.
+    """
+    global _foreground_hook, _last_foreground_hwnd
+    with _foreground_hook_lock:
+        hook, _foreground_hook = _foreground_hook, None
+        _last_foreground_hwnd = 0
+    if hook:
+        _stop_event_hook(hook)
+
+@_wrap_win32
+def wait_for_foreground(hwnd: int, timeout: float) -> bool:
+    """
+    Block until `hwnd` becomes the foreground window or `timeout` seconds pass.
+
+    An EVENT_SYSTEM_FOREGROUND WinEvent hook is installed on a short-lived
+    helper thread (out-of-context hooks are delivered through that thread's
+    message loop), so no polling happens while waiting.
+
+    Returns:
+        True if the window is (or became) the foreground window in time.
+    """
+    activated = threading.Event()
+
+    def _on_event(_event, event_hwnd, _id_object, _id_child, _event_time):
+        if event_hwnd == hwnd:
+            activated.set()
+
+    hook = _start_event_hook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+                             _on_event, "pywinctl-foreground-wait")
     try:
-        return win32gui.GetForegroundWindow()
-    except pywintypes.error as e:
-        _raise_win_api_error("Failed to get active window HWND")
+        # Checked after the hook is live so a change in between is not missed.
+        # Asks the system directly: the tracker's cache may lag behind by an event.
+        if _GetForegroundWindow() == hwnd:
+            return True
+        return activated.wait(timeout)
+    finally:
+        _stop_event_hook(hook)
 
 def get_window_classname(hwnd: int) -> str:
-    """Get the class name of the window."""
-    _check_hwnd(hwnd)
-    try:
-        return win32gui.GetClassName(hwnd)
-    except pywintypes.error as e:
-        if e.winerror == 1400:
-            raise InvalidWindowError(f"Window with HWND {hwnd} is invalid.") from e
-        _raise_win_api_error(f"Failed to get class name for HWND {hwnd}", hwnd)
\ No newline at end of file
+    """Get the class name of the window (via this thread's reusable buffer)."""
+    return get_window_classname_into(hwnd, text_buffer())
+
+@_wrap_win32
+def get_window_classname_into(hwnd: int, buf) -> str:
+    """
+    Get the class name of the window, reading it into a caller-supplied unicode buffer
+    (see text_buffer()). Class names are limited to 256 characters.
+    """
+    if not _GetClassNameW(hwnd, buf, len(buf)):
+        _raise_ctypes_error(f"Failed to get class name for HWND {hwnd}", hwnd)
+    return buf.value
\ No newline at end of file